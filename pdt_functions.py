@@ -40,6 +40,16 @@ from .pdt_msg_strings import (
 )
 
 
+def debug_enabled():
+    """Return True if PDT's or Blender's debug flags are set.
+
+    Callers can check this before building expensive debug messages.
+    """
+
+    pdt_debug = bpy.context.preferences.addons[__package__].preferences.debug
+    return bpy.app.debug or bpy.app.debug_python or pdt_debug
+
+
 def debug(msg, prefix=""):
     """Print a debug message to the console if PDT's or Blender's debug flags are set.
 
@@ -48,8 +58,7 @@ def debug(msg, prefix=""):
     {prefix}{caller file name:line number}| {msg}
     """
 
-    pdt_debug = bpy.context.preferences.addons[__package__].preferences.debug
-    if  bpy.app.debug or bpy.app.debug_python or pdt_debug:
+    if debug_enabled():
         import traceback
 
         def extract_filename(fullpath):
@@ -293,24 +302,32 @@ def euler_to_quaternion(roll, pitch, yaw):
     """Converts Euler Rotation to Quaternion Rotation.
 
     Args:
-        roll: Roll in Euler rotation
-        pitch: Pitch in Euler rotation
-        yaw: Yaw in Euler rotation
+        roll: Roll in Euler rotation (radians, about X)
+        pitch: Pitch in Euler rotation (radians, about Y)
+        yaw: Yaw in Euler rotation (radians, about Z)
 
     Returns:
         Quaternion Rotation.
     """
 
-    # fmt: off
-    qx = (np.sin(roll/2) * np.cos(pitch/2) * np.cos(yaw/2)
-          - np.cos(roll/2) * np.sin(pitch/2) * np.sin(yaw/2))
-    qy = (np.cos(roll/2) * np.sin(pitch/2) * np.cos(yaw/2)
-          + np.sin(roll/2) * np.cos(pitch/2) * np.sin(yaw/2))
-    qz = (np.cos(roll/2) * np.cos(pitch/2) * np.sin(yaw/2)
-          - np.sin(roll/2) * np.sin(pitch/2) * np.cos(yaw/2))
-    qw = (np.cos(roll/2) * np.cos(pitch/2) * np.cos(yaw/2)
-          + np.sin(roll/2) * np.sin(pitch/2) * np.sin(yaw/2))
-    # fmt: on
+    # Single axis rotations reduce to (cos(a/2), sin(a/2) * axis)
+    if pitch == 0.0 and yaw == 0.0:
+        return Quaternion((cos(roll / 2), sin(roll / 2), 0.0, 0.0))
+    if roll == 0.0 and yaw == 0.0:
+        return Quaternion((cos(pitch / 2), 0.0, sin(pitch / 2), 0.0))
+    if roll == 0.0 and pitch == 0.0:
+        return Quaternion((cos(yaw / 2), 0.0, 0.0, sin(yaw / 2)))
+
+    c1 = cos(roll / 2)
+    s1 = sin(roll / 2)
+    c2 = cos(pitch / 2)
+    s2 = sin(pitch / 2)
+    c3 = cos(yaw / 2)
+    s3 = sin(yaw / 2)
+    qx = s1 * c2 * c3 - c1 * s2 * s3
+    qy = c1 * s2 * c3 + s1 * c2 * s3
+    qz = c1 * c2 * s3 - s1 * s2 * c3
+    qw = c1 * c2 * c3 + s1 * s2 * s3
     return Quaternion((qw, qx, qy, qz))
 
 
@@ -27,8 +27,54 @@
 import bpy
 from bpy.types import Operator
 from math import pi
-from mathutils import Quaternion
-from .pdt_functions import debug, euler_to_quaternion
+from mathutils import Matrix, Quaternion
+from .pdt_functions import debug, debug_enabled, euler_to_quaternion
+
+_view_orbit = bpy.ops.view3d.view_orbit
+_view_roll = bpy.ops.view3d.view_roll
+
+_DEG2RAD = pi / 180.0
+_ZERO3 = (-0.0, -0.0, -0.0)
+# Isometric view rotation - try working this out in your head!
+_ISO_QUAT = Quaternion((0.8205, 0.4247, -0.1759, -0.3399))
+# The default view_distance to the origin when starting up Blender
+_DEFAULT_VIEW_DISTANCE = 17.986562728881836
+# The default view_matrix when starting up Blender
+_DEFAULT_VIEW_MATRIX = Matrix(
+    (
+        (0.41, -0.4017, 0.8188, 0.0),
+        (0.912, 0.1936, -0.3617, 0.0),
+        (-0.0133, 0.8950, 0.4458, 0.0),
+        (0.0, 0.0, -17.9866, 1.0)
+    )
+)
+
+
+def _first_view3d(screen):
+    """Return the first 3D View area of the screen, or None if there is none."""
+    return next((a for a in screen.areas if a.type == "VIEW_3D"), None)
+
+
+def _first_region3d(screen):
+    """Return the 3D region of the first 3D View area, or None if there is none."""
+    area = _first_view3d(screen)
+    return area.spaces[0].region_3d if area is not None else None
+
+
+def _do_orbit(context, kind, _orbit=_view_orbit, _deg=_DEG2RAD):
+    """Orbit the 3D View by the PDT Delta Angle.
+
+    Args:
+        context: Blender bpy.context instance.
+        kind: view3d.view_orbit type, e.g. "ORBITLEFT"
+
+    Returns:
+        Status Set.
+    """
+
+    if _first_view3d(context.screen) is not None:
+        _orbit(angle=context.scene.pdt_pg.vrotangle * _deg, type=kind)
+    return {"FINISHED"}
 
 
 class PDT_OT_ViewRot(Operator):
@@ -56,14 +102,13 @@ class PDT_OT_ViewRot(Operator):
 
         scene = context.scene
         pg = scene.pdt_pg
-        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-        if len(areas) > 0:
+        region_3d = _first_region3d(context.screen)
+        if region_3d is not None:
+            rc = pg.rotation_coords
             roll_value = euler_to_quaternion(
-                pg.rotation_coords.x * pi / 180,
-                pg.rotation_coords.y * pi / 180,
-                pg.rotation_coords.z * pi / 180
+                rc.x * _DEG2RAD, rc.y * _DEG2RAD, rc.z * _DEG2RAD
             )
-            areas[0].spaces.active.region_3d.view_rotation = roll_value
+            region_3d.view_rotation = roll_value
         return {"FINISHED"}
 
 
@@ -88,12 +133,7 @@ class PDT_OT_vRotL(Operator):
         Returns: Status Set.
         """
 
-        scene = context.scene
-        pg = scene.pdt_pg
-        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-        if len(areas) > 0:
-            bpy.ops.view3d.view_orbit(angle=(pg.vrotangle * pi / 180), type="ORBITLEFT")
-        return {"FINISHED"}
+        return _do_orbit(context, "ORBITLEFT")
 
 
 class PDT_OT_vRotR(Operator):
@@ -118,12 +158,7 @@ class PDT_OT_vRotR(Operator):
             Status Set.
         """
 
-        scene = context.scene
-        pg = scene.pdt_pg
-        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-        if len(areas) > 0:
-            bpy.ops.view3d.view_orbit(angle=(pg.vrotangle * pi / 180), type="ORBITRIGHT")
-        return {"FINISHED"}
+        return _do_orbit(context, "ORBITRIGHT")
 
 
 class PDT_OT_vRotU(Operator):
@@ -148,12 +183,7 @@ class PDT_OT_vRotU(Operator):
             Status Set.
         """
 
-        scene = context.scene
-        pg = scene.pdt_pg
-        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-        if len(areas) > 0:
-            bpy.ops.view3d.view_orbit(angle=(pg.vrotangle * pi / 180), type="ORBITUP")
-        return {"FINISHED"}
+        return _do_orbit(context, "ORBITUP")
 
 
 class PDT_OT_vRotD(Operator):
@@ -178,12 +208,7 @@ class PDT_OT_vRotD(Operator):
             Status Set.
         """
 
-        scene = context.scene
-        pg = scene.pdt_pg
-        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-        if len(areas) > 0:
-            bpy.ops.view3d.view_orbit(angle=(pg.vrotangle * pi / 180), type="ORBITDOWN")
-        return {"FINISHED"}
+        return _do_orbit(context, "ORBITDOWN")
 
 
 class PDT_OT_vRoll(Operator):
@@ -210,9 +235,8 @@ class PDT_OT_vRoll(Operator):
 
         scene = context.scene
         pg = scene.pdt_pg
-        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-        if len(areas) > 0:
-            bpy.ops.view3d.view_roll(angle=(pg.vrotangle * pi / 180), type="ANGLE")
+        if _first_view3d(context.screen) is not None:
+            _view_roll(angle=(pg.vrotangle * _DEG2RAD), type="ANGLE")
         return {"FINISHED"}
 
 
@@ -235,12 +259,9 @@ class PDT_OT_viso(Operator):
             Status Set.
         """
 
-        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-        if len(areas) > 0:
-            # Try working this out in your head!
-            areas[0].spaces.active.region_3d.view_rotation = Quaternion(
-                (0.8205, 0.4247, -0.1759, -0.3399)
-            )
+        region_3d = _first_region3d(context.screen)
+        if region_3d is not None:
+            region_3d.view_rotation = _ISO_QUAT
         return {"FINISHED"}
 
 
@@ -261,35 +282,31 @@ class PDT_OT_Reset3DView(Operator):
             Status Set.
         """
 
-        # The default view_distance to the origin when starting up Blender
-        default_view_distance = 17.986562728881836
-        # The default view_matrix when starting up Blender
-        default_view_matrix = (
-            (0.41, -0.4017, 0.8188, 0.0),
-            (0.912, 0.1936, -0.3617, 0.0),
-            (-0.0133, 0.8950, 0.4458, 0.0),
-            (0.0, 0.0, -17.9866, 1.0)
-        )
-
+        dbg = debug_enabled()
         for area in (a for a in context.screen.areas if a.type == 'VIEW_3D'):
             view = area.spaces[0].region_3d
             if view is not None:
-                debug(f"is_orthographic_side_view: {view.is_orthographic_side_view}")
+                if dbg:
+                    debug(f"is_orthographic_side_view: {view.is_orthographic_side_view}")
                 if view.is_orthographic_side_view:
                     # When the view is orthographic, reset the distance and location.
                     # The rotation already fits.
-                    debug(f"view_distance before reset: {view.view_distance}")
-                    debug(f"view_location before reset: {view.view_location}")
-                    view.view_distance = default_view_distance
-                    view.view_location = (-0.0, -0.0, -0.0)
+                    if dbg:
+                        debug(f"view_distance before reset: {view.view_distance}")
+                        debug(f"view_location before reset: {view.view_location}")
+                    view.view_distance = _DEFAULT_VIEW_DISTANCE
+                    view.view_location = _ZERO3
                     view.update()
-                    debug(f"view_distance AFTER reset: {view.view_distance}")
-                    debug(f"view_location AFTER reset: {view.view_location}")
+                    if dbg:
+                        debug(f"view_distance AFTER reset: {view.view_distance}")
+                        debug(f"view_location AFTER reset: {view.view_location}")
                 else:
                     # Otherwise, the view matrix needs to be reset (includes distance).
-                    debug(f"view_matrix before reset:\n{view.view_matrix}")
-                    view.view_matrix = default_view_matrix
+                    if dbg:
+                        debug(f"view_matrix before reset:\n{view.view_matrix}")
+                    view.view_matrix = _DEFAULT_VIEW_MATRIX
                     view.update()
-                    debug(f"view_matrix AFTER reset:\n{view.view_matrix}")
+                    if dbg:
+                        debug(f"view_matrix AFTER reset:\n{view.view_matrix}")
 
         return {'FINISHED'}